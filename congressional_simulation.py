@@ -14,7 +14,6 @@ from simulation_base.condorcet_election import CondorcetElection
 from simulation_base.gaussian_generator import GaussianGenerator
 from simulation_base.election_result import ElectionResult
 from simulation_base.actual_custom_election import ActualCustomElection
-from simulation_base.ballot import RCVBallot
 from simulation_base.cook_political_data import CookPoliticalData
 
 
@@ -119,10 +118,7 @@ class CongressionalSimulation:
         # Generate election definition
         election_def = self.config.generate_definition(district, self.gaussian_generator)
         
-        ballots = []
-        for voter in election_def.population.voters:
-            ballot = RCVBallot(voter, election_def.candidates, election_def.config, self.gaussian_generator)
-            ballots.append(ballot)
+        ballots = election_def.ballots()
         
         # Run election
         result = election_process.run(election_def.candidates, ballots)
@@ -2,8 +2,8 @@
 Ballot representation for ranked choice voting.
 """
 from dataclasses import dataclass
-from typing import List, Set, Optional
-from .candidate import Candidate
+from typing import List, Optional
+from .candidate import Candidate, CandidateTable
 from .gaussian_generator import GaussianGenerator
 from .voter import Voter
 from .election_config import ElectionConfig
@@ -12,6 +12,7 @@ from .election_config import ElectionConfig
 @dataclass
 class CandidateScore:
     """Score for a candidate on a ballot."""
+    __slots__ = ('candidate', 'score')
     candidate: Candidate
     score: float
 
@@ -19,12 +20,15 @@ class CandidateScore:
 @dataclass
 class RCVBallot:
     """Ranked Choice Voting ballot."""
+    __slots__ = ('voter', 'config', 'gaussian_generator',
+                 'unsorted_candidates', 'sorted_candidates', 'ranking')
     voter: Voter
     config: ElectionConfig
     gaussian_generator: GaussianGenerator
     
     def __init__(self, voter: Voter, candidates: List[Candidate], 
-                 config: ElectionConfig, gaussian_generator: GaussianGenerator):
+                 config: ElectionConfig, gaussian_generator: GaussianGenerator,
+                 candidate_table: Optional[CandidateTable] = None):
         """Initialize ballot with voter and candidates.
         
         Args:
@@ -32,44 +36,44 @@ class RCVBallot:
             candidates: List of candidates to rank
             config: Election configuration
             gaussian_generator: Random number generator for uncertainty and tie-breaking
+            candidate_table: Optional precomputed table for candidates, shared
+                across ballots to avoid re-reading candidate attributes. When
+                given, the table's candidates are the ones ranked; it must be
+                built from the same candidates.
+        
+        Raises:
+            ValueError: If candidate_table was not built from candidates
         """
         self.voter = voter
         self.config = config
         self.gaussian_generator = gaussian_generator
+        if candidate_table is None:
+            candidate_table = CandidateTable.from_list(candidates)
+        else:
+            candidate_table.check_candidates(candidates)
         
-        # Compute scores for all candidates
-        scores = []
-        for candidate in candidates:
-            score = self._compute_score(candidate, config)
-            scores.append(CandidateScore(candidate=candidate, score=score))
+        # Compute scores for all candidates: distance + affinity + uncertainty + quality
+        noise = gaussian_generator.next_gaussians(len(candidate_table.candidates))
+        scores = [CandidateScore(candidate, score) for candidate, score in zip(
+            candidate_table.candidates,
+            candidate_table.scores(voter.ideology, voter.party.tag.short_name, config.uncertainty, noise))]
         
         self.unsorted_candidates = scores
         
         # Sort candidates by score, with random tie-breaking
+        next_boolean = gaussian_generator.next_boolean
+
         def sort_key(cs: CandidateScore) -> tuple:
             # Use negative score for descending order, add random for tie-breaking
-            return (-cs.score, self.gaussian_generator.next_boolean())
+            return (-cs.score, next_boolean())
         
         self.sorted_candidates = sorted(self.unsorted_candidates, key=sort_key)
-    
-    def _compute_score(self, candidate: Candidate, config: ElectionConfig) -> float:
-        """Compute total score for a candidate (moved from Voter.score)."""
-        return (self._distance_score(candidate) +
-                candidate.affinity(self.voter.party.tag.short_name) +
-                self._uncertainty(config) +
-                candidate.quality)
-    
-    def _distance_score(self, candidate: Candidate) -> float:
-        """Calculate distance-based score for a candidate (moved from Voter.distance_score)."""
-        return -abs(self.voter.ideology - candidate.ideology)
-    
-    def _uncertainty(self, config: ElectionConfig) -> float:
-        """Calculate uncertainty factor (moved from Voter.uncertainty)."""
-        return config.uncertainty * self.gaussian_generator()
+        # Preference order as bare candidates, walked by every first-choice lookup
+        self.ranking = [cs.candidate for cs in self.sorted_candidates]
     
     def candidate(self, active_candidates: List[Candidate]) -> Optional[Candidate]:
         """Get the highest-ranked active candidate."""
-        for candidate_score in self.sorted_candidates:
-            if candidate_score.candidate in active_candidates:
-                return candidate_score.candidate
+        for candidate in self.ranking:
+            if candidate in active_candidates:
+                return candidate
         return None
@@ -1,7 +1,7 @@
 """
 Utility functions for ballot construction.
 """
-from typing import List
+from typing import Dict, List, Tuple
 from .ballot import RCVBallot
 from .candidate import Candidate
 from .election_definition import ElectionDefinition
@@ -16,9 +16,31 @@ def create_ballots_from_election_def(election_def: ElectionDefinition) -> List[R
     Returns:
         List of ballots from all voters
     """
-    ballots = []
-    for voter in election_def.population.voters:
-        ballot = RCVBallot(voter, election_def.candidates, election_def.config, 
-                          election_def.gaussian_generator)
-        ballots.append(ballot)
-    return ballots
+    return list(election_def.ballots())
+
+
+def group_ballots(ballots: List[RCVBallot]) -> Tuple[List[RCVBallot], List[float]]:
+    """Collapse ballots with the same party and ranking into weighted ballots.
+    
+    Plurality tallies only read a ballot's party and ranking, so the first
+    ballot of each pattern can stand in for the rest.
+    
+    Args:
+        ballots: Ballots to group
+        
+    Returns:
+        One ballot per distinct pattern and the number of ballots it stands for
+    """
+    index: Dict[tuple, int] = {}
+    patterns: List[RCVBallot] = []
+    weights: List[float] = []
+    for ballot in ballots:
+        key = (ballot.voter.party.tag.short_name, tuple(ballot.ranking))
+        i = index.get(key)
+        if i is None:
+            index[key] = len(patterns)
+            patterns.append(ballot)
+            weights.append(1.0)
+        else:
+            weights[i] += 1.0
+    return patterns, weights
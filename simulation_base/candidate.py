@@ -2,13 +2,18 @@
 Candidate representation for elections.
 """
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from .population_tag import PopulationTag
 
 
-@dataclass
+@dataclass(eq=False)
 class Candidate:
-    """Represents a political candidate."""
+    """Represents a political candidate.
+    
+    Candidates compare and hash by identity: each one is a distinct entrant
+    even if two happen to share every attribute, and names and affinities
+    are updated after construction.
+    """
     name: str
     tag: PopulationTag
     ideology: float
@@ -38,12 +43,65 @@ class Candidate:
             raise KeyError(f"Unknown group '{group}' in affinity map. Available groups: {list(self._affinity_map.keys())}")
         return self._affinity_map[group]
     
-    def __hash__(self) -> int:
-        """Make Candidate hashable."""
-        affinity_tuple = tuple(sorted(self._affinity_map.items())) if self._affinity_map else ()
-        return hash((self.name, self.tag, self.ideology, self.quality, 
-                    self.incumbent, affinity_tuple))
-    
     def affinity_string(self) -> str:
         """Return a string representation of the candidate's affinity."""
         return ", ".join([f"{k:5s}: {v: 6.2f}" for k, v in self._affinity_map.items()])
+
+
+@dataclass
+class CandidateTable:
+    """Column-wise view of a candidate list used when scoring many ballots.
+    
+    Candidate attributes are read once per election instead of once per
+    voter; affinity columns are built lazily for each voter group.
+    """
+    candidates: List[Candidate]
+    ideologies: List[float]
+    qualities: List[float]
+    _affinities: Dict[str, List[float]] = field(default_factory=dict, init=False, repr=False)
+    
+    @staticmethod
+    def from_list(candidates: List[Candidate]) -> 'CandidateTable':
+        """Build a table from a list of candidates."""
+        candidates = list(candidates)
+        return CandidateTable(
+            candidates=candidates,
+            ideologies=[c.ideology for c in candidates],
+            qualities=[c.quality for c in candidates]
+        )
+    
+    def check_candidates(self, candidates: List[Candidate]) -> None:
+        """Check that this table was built from exactly these candidates, in order.
+        
+        Raises:
+            ValueError: If the candidates differ from the table's
+        """
+        if (len(self.candidates) != len(candidates)
+                or any(t is not c for t, c in zip(self.candidates, candidates))):
+            raise ValueError("candidate table does not match the given candidates")
+    
+    def scores(self, ideology: float, group: str, uncertainty: float,
+               noise: List[float]) -> List[float]:
+        """Score every candidate for a voter: distance + affinity + uncertainty + quality.
+        
+        Args:
+            ideology: The voter's ideology
+            group: The voter's group short name, used for affinity
+            uncertainty: Scale applied to the noise
+            noise: One standard gaussian draw per candidate
+        """
+        return [-abs(ideology - candidate_ideology) + affinity + uncertainty * z + quality
+                for candidate_ideology, affinity, quality, z in zip(
+                    self.ideologies, self.affinities(group), self.qualities, noise)]
+    
+    def affinities(self, group: str) -> List[float]:
+        """Affinity of every candidate for a specific group.
+        
+        Raises:
+            KeyError: If the group is not found in a candidate's affinity map
+        """
+        column = self._affinities.get(group)
+        if column is None:
+            column = [c.affinity(group) for c in self.candidates]
+            self._affinities[group] = column
+        return column
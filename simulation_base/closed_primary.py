@@ -5,7 +5,7 @@ from typing import List, Optional
 from dataclasses import dataclass
 from .election_result import ElectionResult, CandidateResult
 from .election_process import ElectionProcess
-from .candidate import Candidate
+from .candidate import Candidate, CandidateTable
 from .population_tag import DEMOCRATS, REPUBLICANS
 from .simple_plurality import SimplePlurality
 from .plurality_with_runoff import PluralityWithRunoff
@@ -167,9 +167,11 @@ class ClosedPrimary(ElectionProcess):
             # Create new ballots for skewed voters
             # Use config from first ballot (assuming all ballots have same config)
 
-            dem_ballots = [RCVBallot(voter, dem_candidates, election_config, ballots[0].gaussian_generator) 
+            dem_table = CandidateTable.from_list(dem_candidates)
+            rep_table = CandidateTable.from_list(rep_candidates)
+            dem_ballots = [RCVBallot(voter, dem_candidates, election_config, ballots[0].gaussian_generator, dem_table) 
                           for voter in primary_dem_voters]
-            rep_ballots = [RCVBallot(voter, rep_candidates, election_config, ballots[0].gaussian_generator) 
+            rep_ballots = [RCVBallot(voter, rep_candidates, election_config, ballots[0].gaussian_generator, rep_table) 
                           for voter in primary_rep_voters]
         else:
             # Use original ballots filtered by party
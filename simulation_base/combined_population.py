@@ -129,7 +129,20 @@ class CombinedPopulation:
     def _population_sample(self, n_samples: int) -> List[Voter]:
         """Generate a sample of voters from all population groups."""
         voters = []
-        for p in self.populations:
-            n_group_samples = int(p.weight * n_samples / self.summed_weight)
+        for p, n_group_samples in zip(self.populations, self._group_sample_sizes(n_samples)):
             voters.extend(p.population_sample(n_group_samples, self.gaussian_generator))
         return voters
+    
+    def _group_sample_sizes(self, n_samples: int) -> List[int]:
+        """Split n_samples across the groups in proportion to their weights.
+        
+        Each group gets the integer part of its share and the leftover samples
+        go to the groups with the largest fractional parts, so the sizes always
+        add up to n_samples.
+        """
+        quotas = [p.weight * n_samples / self.summed_weight for p in self.populations]
+        sizes = [int(q) for q in quotas]
+        by_remainder = sorted(range(len(quotas)), key=lambda i: quotas[i] - sizes[i], reverse=True)
+        for i in by_remainder[:n_samples - sum(sizes)]:
+            sizes[i] += 1
+        return sizes
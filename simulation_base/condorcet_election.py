@@ -1,13 +1,15 @@
 """
 Condorcet election implementation using pairwise SimplePlurality elections.
 """
+from collections import Counter
 from typing import List, Dict
 from dataclasses import dataclass
 from .candidate import Candidate
 from .ballot import RCVBallot
 from .election_result import ElectionResult, CandidateResult
 from .election_process import ElectionProcess
-from .simple_plurality import SimplePlurality, SimplePluralityResult
+from .simple_plurality import SimplePluralityResult
+from .population_tag import DEMOCRATS, REPUBLICANS, INDEPENDENTS
 
 
 @dataclass
@@ -148,15 +150,19 @@ class CondorcetElection(ElectionProcess):
     
     def run(self, candidates: List[Candidate], ballots: List[RCVBallot]) -> CondorcetResult:
         """Run Condorcet election with the given candidates and ballots."""
-        # Compute all pairwise comparisons using SimplePlurality
+        # Tally every pairwise preference in one pass over the ballots
+        pairwise_votes = self._pairwise_votes(candidates, ballots)
         comparisons = []
         
         for i, candidate_i in enumerate(candidates):
             for j, candidate_j in enumerate(candidates):
                 if j > i:
-                    # Run a SimplePlurality election between these two candidates
-                    plurality = SimplePlurality(debug=self.debug)
-                    result = plurality.run([candidate_i, candidate_j], ballots)
+                    # Equivalent to a SimplePlurality election between these two candidates
+                    breakdown = {candidate_i.name: pairwise_votes[i][j],
+                                 candidate_j.name: pairwise_votes[j][i]}
+                    results = {candidate_i: sum(pairwise_votes[i][j].values()),
+                               candidate_j: sum(pairwise_votes[j][i].values())}
+                    result = SimplePluralityResult(results, breakdown)
                     comparison = PairwiseComparison(result=result)
                     comparisons.append(comparison)
         
@@ -168,4 +174,33 @@ class CondorcetElection(ElectionProcess):
         condorcet_result._voter_satisfaction = voter_satisfaction
         
         return condorcet_result
+    
+    def _pairwise_votes(self, candidates: List[Candidate],
+                        ballots: List[RCVBallot]) -> List[List[Dict[str, float]]]:
+        """Count ballots preferring each candidate over each other candidate.
+        
+        Returns a matrix where entry [i][j] maps voter party to the number of
+        ballots ranking candidates[i] above candidates[j].  Ballots with the
+        same party and ranking are grouped first, so each distinct ranking is
+        expanded into pairwise preferences only once.
+        """
+        index = {c: i for i, c in enumerate(candidates)}
+        rankings: Counter = Counter()
+        for ballot in ballots:
+            ranking = tuple(index[c] for c in ballot.ranking if c in index)
+            rankings[(ballot.voter.party.tag.short_name, ranking)] += 1
+        
+        n_candidates = len(candidates)
+        parties = [DEMOCRATS.short_name, REPUBLICANS.short_name, INDEPENDENTS.short_name]
+        votes = [[{t: 0.0 for t in parties} for _ in range(n_candidates)]
+                 for _ in range(n_candidates)]
+        for (party, ranking), count in rankings.items():
+            # a candidate is preferred to everyone ranked below it (or not ranked)
+            below = set(range(n_candidates))
+            for i in ranking:
+                below.discard(i)
+                row = votes[i]
+                for j in below:
+                    row[j][party] += count
+        return votes
 
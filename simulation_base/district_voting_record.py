@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class DistrictVotingRecord:
     """Represents voting history and characteristics of a district."""
     district: str
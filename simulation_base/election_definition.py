@@ -1,12 +1,13 @@
 """
 Election definition containing all components needed for an election.
 """
-from dataclasses import dataclass
-from typing import List
-from .candidate import Candidate
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from .candidate import Candidate, CandidateTable
 from .combined_population import CombinedPopulation
 from .election_config import ElectionConfig
 from .gaussian_generator import GaussianGenerator
+from .ballot import RCVBallot
 
 
 @dataclass
@@ -17,5 +18,29 @@ class ElectionDefinition:
     config: ElectionConfig
     gaussian_generator: GaussianGenerator
     state: str
+    _ballots: Optional[List[RCVBallot]] = field(default=None, init=False, repr=False, compare=False)
+    _ballot_key: Optional[Tuple[CombinedPopulation, ElectionConfig, GaussianGenerator, Tuple[Candidate, ...]]] = field(default=None, init=False, repr=False, compare=False)
+
     def district(self) -> str:
         return self.population.district.district
+
+    def ballots(self) -> List[RCVBallot]:
+        """Ballots from every voter in the population for the current candidates.
+
+        The voter/candidate scores are computed once and cached so that several
+        election processes run on this definition see the same ballots.  The
+        cache is rebuilt if the candidates, population, config or generator
+        are replaced.  Callers must not modify the returned list.
+        """
+        candidates = tuple(self.candidates)
+        key = self._ballot_key
+        # The key holds the objects themselves so they cannot be freed and
+        # their ids reused while the cached ballots are alive.
+        if (self._ballots is None or key[0] is not self.population or key[1] is not self.config
+                or key[2] is not self.gaussian_generator or len(key[3]) != len(candidates)
+                or any(a is not b for a, b in zip(key[3], candidates))):
+            table = CandidateTable.from_list(self.candidates)
+            self._ballots = [RCVBallot(voter, self.candidates, self.config, self.gaussian_generator, table)
+                             for voter in self.population.voters]
+            self._ballot_key = (self.population, self.config, self.gaussian_generator, candidates)
+        return self._ballots
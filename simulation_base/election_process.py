@@ -2,12 +2,29 @@
 Abstract base class for election processes.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from .election_result import ElectionResult
 from .ballot import RCVBallot
 from .candidate import Candidate
 
 
+def check_weights(ballots: List[RCVBallot], weights: Optional[List[float]]) -> None:
+    """Check that weights, if given, are usable as per-ballot vote counts.
+    
+    Raises:
+        ValueError: If there is not one weight per ballot, any weight is
+            negative, or the weights sum to zero
+    """
+    if weights is None:
+        return
+    if len(weights) != len(ballots):
+        raise ValueError(f"got {len(weights)} weights for {len(ballots)} ballots")
+    if any(w < 0 for w in weights):
+        raise ValueError("ballot weights must not be negative")
+    if sum(weights) == 0:
+        raise ValueError("ballot weights must not sum to zero")
+
+
 class ElectionProcess(ABC):
     """Abstract base class for all election processes."""
     
@@ -30,7 +47,14 @@ class ElectionProcess(ABC):
         """Name of the election process."""
         pass
 
-    def voter_satisfaction(self, winner: Candidate, ballots: List[RCVBallot]):
-        left_voter_count = sum(1 for ballot in ballots if ballot.voter.ideology < winner.ideology)
-        return 1 - abs((2.0 * left_voter_count / len(ballots)) - 1) 
+    def voter_satisfaction(self, winner: Candidate, ballots: List[RCVBallot],
+                           weights: Optional[List[float]] = None):
+        check_weights(ballots, weights)
+        if weights is None:
+            left_voter_count = sum(1 for ballot in ballots if ballot.voter.ideology < winner.ideology)
+            n_voters = len(ballots)
+        else:
+            left_voter_count = sum(w for ballot, w in zip(ballots, weights) if ballot.voter.ideology < winner.ideology)
+            n_voters = sum(weights)
+        return 1 - abs((2.0 * left_voter_count / n_voters) - 1) 
 
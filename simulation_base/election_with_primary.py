@@ -2,7 +2,7 @@
 Election with primary system implementation.
 """
 from typing import List
-from .candidate import Candidate
+from .candidate import Candidate, CandidateTable
 from .election_result import ElectionResult
 from .population_tag import DEMOCRATS, REPUBLICANS
 from .simple_plurality import SimplePlurality
@@ -91,9 +91,11 @@ class ElectionWithPrimary(ElectionProcess):
             # Create new ballots for skewed voters
             # Use config from first ballot (assuming all ballots have same config)
             config = ballots[0].config
-            dem_ballots = [RCVBallot(voter, dem_candidates, config, ballots[0].gaussian_generator) 
+            dem_table = CandidateTable.from_list(dem_candidates)
+            rep_table = CandidateTable.from_list(rep_candidates)
+            dem_ballots = [RCVBallot(voter, dem_candidates, config, ballots[0].gaussian_generator, dem_table) 
                           for voter in primary_dem_voters]
-            rep_ballots = [RCVBallot(voter, rep_candidates, config, ballots[0].gaussian_generator) 
+            rep_ballots = [RCVBallot(voter, rep_candidates, config, ballots[0].gaussian_generator, rep_table) 
                           for voter in primary_rep_voters]
         else:
             # Use original ballots filtered by party
@@ -2,9 +2,10 @@
 Gaussian random number generator for simulation.
 """
 import random
-from typing import Optional
+from typing import List, Optional
 
 _global_seed = None
+_BOOLEANS = (True, False)
 
 class GaussianGenerator:
     """Generates Gaussian random numbers for simulation."""
@@ -27,10 +28,11 @@ class GaussianGenerator:
             # already created a generator, so increment whatever seed we are using
             _global_seed += 1
             self._random = random.Random(_global_seed)
+        self._gauss = self._random.gauss
 
     def next_boolean(self) -> bool:
         """Generate random boolean."""
-        return self._random.choice([True, False])
+        return self._random.choice(_BOOLEANS)
     
     def next_int(self) -> int:
         """Generate random integer."""
@@ -42,8 +44,15 @@ class GaussianGenerator:
     
     def __call__(self) -> float:
         """Generate Gaussian random number."""
-        v = self._random.gauss(0, 1)
-        return v
+        return self._gauss(0, 1)
+
+    def next_gaussians(self, n: int) -> List[float]:
+        """Generate n Gaussian random numbers in one call.
+
+        Produces the same sequence as n successive calls to the generator.
+        """
+        gauss = self._gauss
+        return [gauss(0, 1) for _ in range(n)]
 
     @staticmethod
     def reset_global_seed() -> None:
@@ -1,13 +1,14 @@
 """
 Instant Runoff Voting (IRV) election implementation.
 """
-from typing import List, Set, Dict
+from typing import List, Dict, Optional
 
 from simulation_base.simple_plurality import SimplePluralityResult
 from simulation_base.simple_plurality import SimplePlurality
 from .election_result import ElectionResult, CandidateResult
 from .candidate import Candidate
 from .ballot import RCVBallot
+from .ballot_utils import group_ballots
 from .voter import Voter
 from .election_process import ElectionProcess
 
@@ -69,8 +70,10 @@ class InstantRunoffElection(ElectionProcess):
     
     def run(self, candidates: List[Candidate], ballots: List[RCVBallot]) -> RCVResult:
         """Run IRV election with the given candidates and ballots."""
-        # Run the election
-        rounds = self._compute_rounds([], ballots, set(candidates), candidates)
+        # Run the election.  Every round is a plurality count over the same
+        # ballots, so count each distinct ballot pattern once with a weight.
+        patterns, weights = group_ballots(ballots)
+        rounds = self._compute_rounds([], patterns, list(candidates), candidates, weights)
         if self.debug:
             self._debug_print(rounds)
         
@@ -87,20 +90,22 @@ class InstantRunoffElection(ElectionProcess):
     
     
     def _compute_round_result(self, ballots: List[RCVBallot], 
-                             active_candidates: Set[Candidate],
-                             candidates: List[Candidate]) -> SimplePluralityResult:
+                             active_candidates: List[Candidate],
+                             candidates: List[Candidate],
+                             weights: Optional[List[float]] = None) -> SimplePluralityResult:
         # use a simpleplurality here!
         """Compute result for a single round."""
         simple_plurality = SimplePlurality(debug=self.debug)
-        return simple_plurality.run(active_candidates, ballots)
+        return simple_plurality.run(active_candidates, ballots, weights)
     
     def _compute_rounds(self, prior_rounds: List[SimplePluralityResult], 
                        ballots: List[RCVBallot], 
-                       active_candidates: Set[Candidate],
-                       candidates: List[Candidate]) -> List[SimplePluralityResult]:
+                       active_candidates: List[Candidate],
+                       candidates: List[Candidate],
+                       weights: Optional[List[float]] = None) -> List[SimplePluralityResult]:
         """Compute all rounds of IRV."""
-        n_ballots = len(ballots)
-        round_result = self._compute_round_result(ballots, active_candidates, candidates)
+        n_ballots = len(ballots) if weights is None else sum(weights)
+        round_result = self._compute_round_result(ballots, active_candidates, candidates, weights)
         
         # Check if we have a majority winner
         if round_result.ordered_results() and round_result.ordered_results()[0].votes / n_ballots >= 0.5:
@@ -109,9 +114,11 @@ class InstantRunoffElection(ElectionProcess):
             # Eliminate last place candidate
             if round_result.ordered_results():
                 eliminated_candidate = round_result.ordered_results()[-1].candidate
-                new_candidates = active_candidates - {eliminated_candidate}
+                # keep the remaining candidates in their original order so that
+                # ties for last place are broken the same way on every run
+                new_candidates = [c for c in active_candidates if c is not eliminated_candidate]
                 return self._compute_rounds(prior_rounds + [round_result], 
-                                          ballots, new_candidates, candidates)
+                                          ballots, new_candidates, candidates, weights)
             else:
                 return prior_rounds + [round_result]
     
@@ -5,7 +5,7 @@ from typing import List, Optional
 from .election_result import ElectionResult, CandidateResult
 from .election_process import ElectionProcess
 from .ballot import RCVBallot
-from .candidate import Candidate
+from .candidate import Candidate, CandidateTable
 from .population_tag import DEMOCRATS, REPUBLICANS, INDEPENDENTS
 from .simple_plurality import SimplePlurality
 from .plurality_with_runoff import PluralityWithRunoff
@@ -174,7 +174,7 @@ class OpenPrimary(ElectionProcess):
             # they only have about a 45% chance of voting in the primary.
             if ballot.voter.party.tag == INDEPENDENTS and gaussian_generator.next_float() > .45:
                 continue
-            first_choice = ballot.sorted_candidates[0].candidate
+            first_choice = ballot.ranking[0]
             
             # In semi-closed primaries, prevent cross-party voting
             if self.semi_closed:
@@ -240,6 +240,7 @@ class OpenPrimary(ElectionProcess):
         from .ballot import RCVBallot
         from .voter import Voter
         
+        candidate_table = CandidateTable.from_list(candidates)
         skewed_ballots = []
         for ballot in ballots:
             # Create skewed voter
@@ -258,7 +259,8 @@ class OpenPrimary(ElectionProcess):
                 voter=skewed_voter,
                 candidates=candidates,
                 config=ballot.config,
-                gaussian_generator=ballot.gaussian_generator
+                gaussian_generator=ballot.gaussian_generator,
+                candidate_table=candidate_table
             )
             skewed_ballots.append(skewed_ballot)
         
@@ -1,10 +1,11 @@
 """
 Plurality with runoff voting implementation.
 """
-from typing import List
+from typing import List, Optional
 from .election_result import ElectionResult
 from .election_process import ElectionProcess
 from .ballot import RCVBallot
+from .ballot_utils import group_ballots
 from .candidate import Candidate
 from .simple_plurality import SimplePlurality
 
@@ -22,27 +23,39 @@ class PluralityWithRunoff(ElectionProcess):
         """Name of the election process."""
         return "pluralityWithRunoff"
 
-    def run(self, candidates: List[Candidate], ballots: List[RCVBallot]) -> ElectionResult:
-        """Run plurality with runoff election with the given candidates and ballots."""
+    def run(self, candidates: List[Candidate], ballots: List[RCVBallot],
+            weights: Optional[List[float]] = None) -> ElectionResult:
+        """Run plurality with runoff election with the given candidates and ballots.
+        
+        Optional per-ballot weights are passed through to both rounds.
+        """
+        # Both rounds read only each ballot's party and ranking, so unweighted
+        # ballots are grouped once and each distinct pattern is counted once
+        if weights is None:
+            patterns, pattern_weights = group_ballots(ballots)
+        else:
+            patterns, pattern_weights = ballots, weights
+        
         # First round: Use SimplePlurality
-        first_round_result = self.simple_plurality.run(candidates, ballots)
+        first_round_result = self.simple_plurality.run(candidates, patterns, pattern_weights)
         
         # Calculate total votes
         total_votes = first_round_result.n_votes
+        # Only the leader and the runner-up matter here
+        top_results = first_round_result.top_results(2)
+        top_candidate = top_results[0].candidate
         
-        # Check if top candidate has majority (> 50%)
-        if total_votes > 0:
-            top_candidate_votes = first_round_result.ordered_results()[0].votes
-            if (top_candidate_votes / total_votes) > 0.5:
-                # Top candidate has majority, no runoff needed
-                first_round_result._voter_satisfaction = self.voter_satisfaction(first_round_result.winner(), ballots)
-                return first_round_result
+        # Check if top candidate has majority (> 50%); compare twice the
+        # leader's votes against the total rather than dividing
+        if total_votes > 0 and 2 * top_results[0].votes > total_votes:
+            # Top candidate has majority, no runoff needed
+            first_round_result._voter_satisfaction = self.voter_satisfaction(top_candidate, ballots, weights)
+            return first_round_result
         
-        top_candidate = first_round_result.ordered_results()[0].candidate
-        second_candidate = first_round_result.ordered_results()[1].candidate
+        second_candidate = top_results[1].candidate
         
         # Run runoff between top two candidates using SimplePlurality
         runoff_candidates = [top_candidate, second_candidate]
-        runoff_result = self.simple_plurality.run(runoff_candidates, ballots)
-        runoff_result._voter_satisfaction = self.voter_satisfaction(first_round_result.winner(), ballots)
+        runoff_result = self.simple_plurality.run(runoff_candidates, patterns, pattern_weights)
+        runoff_result._voter_satisfaction = self.voter_satisfaction(top_candidate, ballots, weights)
         return runoff_result
\ No newline at end of file
@@ -84,12 +84,11 @@ class PopulationGroup:
     def population_sample(self, n_samples: int, gaussian_generator: GaussianGenerator) -> List['Voter']:
         """Generate a sample of voters from this population group."""
         from .voter import Voter
-        voters = []
-        for _ in range(n_samples):
-            # Generate Gaussian sample
-            sample = gaussian_generator() * self.stddev + self.mean
-            voters.append(Voter(party=self, ideology=sample))
-        return voters
+        # Draw all of the group's Gaussian samples at once
+        stddev = self.stddev
+        mean = self.mean
+        return [Voter(party=self, ideology=sample * stddev + mean)
+                for sample in gaussian_generator.next_gaussians(n_samples)]
     
     def random_voter(self, gaussian_generator: GaussianGenerator) -> 'Voter':
         """Generate a random voter from this group."""
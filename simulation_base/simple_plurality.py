@@ -1,14 +1,16 @@
 """
 Simple plurality voting implementation for primaries.
 """
-from typing import List, Dict
+import heapq
+from itertools import repeat
+from typing import List, Dict, Optional
 
 from simulation_base.population_tag import INDEPENDENTS, DEMOCRATS, REPUBLICANS
 from .election_result import ElectionResult, CandidateResult
 from .ballot import RCVBallot
 from .candidate import Candidate
 from .population_tag import PopulationTag
-from .election_process import ElectionProcess
+from .election_process import ElectionProcess, check_weights
 
 
 class SimplePluralityResult(ElectionResult):
@@ -23,7 +25,7 @@ class SimplePluralityResult(ElectionResult):
     
     def winner(self) -> Candidate:
         """Return the winning candidate."""
-        return self.ordered_results()[0].candidate
+        return self.top_results(1)[0].candidate
     
     def voter_satisfaction(self) -> float:
         """Return the voter satisfaction score."""
@@ -45,6 +47,12 @@ class SimplePluralityResult(ElectionResult):
         return sorted([CandidateResult(candidate=c, votes=v) 
                       for c, v in self._results.items()],
                      key=lambda x: x.votes, reverse=True)
+
+    def top_results(self, n: int) -> List[CandidateResult]:
+        """Return the first n entries of ordered_results() without sorting every candidate."""
+        return heapq.nlargest(n, (CandidateResult(candidate=c, votes=v)
+                                  for c, v in self._results.items()),
+                              key=lambda x: x.votes)
     
     @property
     def n_votes(self) -> float:
@@ -64,30 +72,42 @@ class SimplePlurality(ElectionProcess):
         """Name of the election process."""
         return "simplePlurality"
     
-    def run(self, candidates: List[Candidate], ballots: List[RCVBallot]) -> SimplePluralityResult:
-        """Run simple plurality election with the given candidates and ballots."""
-        # Count first-choice votes
-
-
-        # use string based dicts because hashing objects is slow 
-        raw_results = {}
-        breakdown = {}
-        for c in candidates:
-            raw_results[c.name] = 0.0
-            breakdown[c.name] = {DEMOCRATS.short_name: 0.0, REPUBLICANS.short_name: 0.0, INDEPENDENTS.short_name: 0.0}
-
+    def run(self, candidates: List[Candidate], ballots: List[RCVBallot],
+            weights: Optional[List[float]] = None) -> SimplePluralityResult:
+        """Run simple plurality election with the given candidates and ballots.
+        
+        If weights is given, ballots[i] counts as weights[i] votes, so callers
+        can pass one ballot per distinct voting pattern.
+        
+        Raises:
+            ValueError: If weights are given and check_weights() rejects them
+        """
+        # Count first-choice votes into per-candidate slots
+        index = {c: i for i, c in enumerate(candidates)}
+        counts = [0.0] * len(candidates)
+        party_counts = {DEMOCRATS.short_name: [0.0] * len(candidates),
+                        REPUBLICANS.short_name: [0.0] * len(candidates),
+                        INDEPENDENTS.short_name: [0.0] * len(candidates)}
 
-        for ballot in ballots:
+        check_weights(ballots, weights)
+        ballot_weights = repeat(1.0) if weights is None else weights
+        for ballot, weight in zip(ballots, ballot_weights):
             # Get first choice candidate
-            first_choice = ballot.candidate(candidates).name
-            breakdown[first_choice][ballot.voter.party.tag.short_name] += 1.0
-            raw_results[first_choice] += 1.0
-        
-        results = {}
-        cmap = {c.name: c for c in candidates}
-        for name, count in raw_results.items():
-            results[cmap[name]] = count
+            for candidate in ballot.ranking:
+                i = index.get(candidate)
+                if i is not None:
+                    break
+            else:
+                # none of the candidates are on this ballot
+                continue
+            counts[i] += weight
+            party_counts[ballot.voter.party.tag.short_name][i] += weight
 
+        results = {}
+        breakdown = {}
+        for i, c in enumerate(candidates):
+            results[c] = counts[i]
+            breakdown[c.name] = {party: votes[i] for party, votes in party_counts.items()}
 
         return SimplePluralityResult(results, breakdown)
     
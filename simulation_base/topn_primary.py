@@ -7,7 +7,7 @@ from simulation_base.population_tag import DEMOCRATS, REPUBLICANS
 from .election_result import ElectionResult, CandidateResult
 from .election_process import ElectionProcess
 from .ballot import RCVBallot
-from .candidate import Candidate
+from .candidate import Candidate, CandidateTable
 from .simple_plurality import SimplePlurality
 
 
@@ -133,6 +133,7 @@ class TopNPrimary(ElectionProcess):
         """Create new ballots with skewed voters for primaries."""
         from .voter import Voter
         
+        candidate_table = CandidateTable.from_list(candidates)
         skewed_ballots = []
         for ballot in ballots:
             # Create skewed voter
@@ -151,7 +152,8 @@ class TopNPrimary(ElectionProcess):
                 voter=skewed_voter,
                 candidates=candidates,
                 config=ballot.config,
-                gaussian_generator=ballot.gaussian_generator
+                gaussian_generator=ballot.gaussian_generator,
+                candidate_table=candidate_table
             )
             skewed_ballots.append(skewed_ballot)
         
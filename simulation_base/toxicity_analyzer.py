@@ -2,7 +2,7 @@
 Toxicity analysis for election simulations.
 """
 from typing import List, Dict
-from .candidate import Candidate
+from .candidate import Candidate, CandidateTable
 from .population_tag import DEMOCRATS, REPUBLICANS, INDEPENDENTS
 from .election_definition import ElectionDefinition
 from .gaussian_generator import GaussianGenerator
@@ -162,7 +162,8 @@ class ToxicityAnalyzer:
                      gaussian_generator: GaussianGenerator):
         """Run an election with the given definition and process."""
         # All election processes now implement the ElectionProcess interface
-        ballots = [RCVBallot(voter, election_def.candidates, election_def.config, gaussian_generator) for voter in election_def.population.voters]
+        table = CandidateTable.from_list(election_def.candidates)
+        ballots = [RCVBallot(voter, election_def.candidates, election_def.config, gaussian_generator, table) for voter in election_def.population.voters]
         return election_process.run(election_def.candidates, ballots)
     
     def test_twin_scenarios(self, election_def: ElectionDefinition, 
@@ -8,6 +8,10 @@ from .population_group import PopulationGroup
 from .population_tag import REPUBLICANS, DEMOCRATS, INDEPENDENTS
 from .district_voting_record import DistrictVotingRecord
 
+DEFAULT_PARTISANSHIP = 1.0
+DEFAULT_SKEW = 0.0 / 30
+DEFAULT_STDDEV = 1.0
+
 
 class UnitPopulation:
     """Generates unit populations for simulation."""
@@ -15,25 +19,25 @@ class UnitPopulation:
     @staticmethod
     def default_partisanship() -> float:
         """Default partisanship value."""
-        return 1.0
+        return DEFAULT_PARTISANSHIP
     
     @staticmethod
     def default_skew() -> float:
         """Default skew factor."""
-        return 0.0 / 30
+        return DEFAULT_SKEW
     
     @staticmethod
     def default_stddev() -> float:
         """Default standard deviation."""
-        return 1.0
+        return DEFAULT_STDDEV
     
     @staticmethod
     def create(dvr: DistrictVotingRecord, n_voters: int, gaussian_generator: GaussianGenerator) -> CombinedPopulation:
         """Create population with default parameters."""
         return UnitPopulation.create_with_params(
-            dvr, UnitPopulation.default_partisanship(), 
-            UnitPopulation.default_stddev(), 
-            UnitPopulation.default_skew(), 
+            dvr, DEFAULT_PARTISANSHIP, 
+            DEFAULT_STDDEV, 
+            DEFAULT_SKEW, 
             n_voters,
             gaussian_generator
         )
@@ -50,8 +54,9 @@ class UnitPopulation:
     def create_from_lean(dvr: DistrictVotingRecord, lean: float, partisanship: float, stddev: float, 
                         skew_factor: float, n_voters: int, gaussian_generator: GaussianGenerator) -> CombinedPopulation:
         """Create population from lean value."""
-        r_pct = 0.5 + (lean / 2 / 100)
-        d_pct = 0.5 - (lean / 2 / 100)
+        half_lean = lean / 200
+        r_pct = 0.5 + half_lean
+        d_pct = 0.5 - half_lean
         return UnitPopulation.create_from_percentages(
             dvr, d_pct, r_pct, partisanship, stddev, skew_factor, n_voters, gaussian_generator
         )
@@ -60,6 +65,8 @@ class UnitPopulation:
     def create_from_percentages(dvr: DistrictVotingRecord, d_pct: float, r_pct: float, partisanship: float,
                                stddev: float, skew_factor: float, n_voters: int, gaussian_generator: GaussianGenerator) -> CombinedPopulation:
         """Create population from party percentages."""
+        if n_voters <= 0:
+            raise ValueError(f"n_voters must be positive, got {n_voters}")
         i_weight = 0.20
         r_weight = max(0.05, (1 - i_weight) * r_pct)
         d_weight = max(0.05, (1 - i_weight) * d_pct)
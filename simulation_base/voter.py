@@ -2,9 +2,9 @@
 Voter representation and behavior.
 """
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from .population_group import PopulationGroup
-from .candidate import Candidate
+from .candidate import Candidate, CandidateTable
 from .election_config import ElectionConfig
 from .gaussian_generator import GaussianGenerator
 
@@ -12,6 +12,7 @@ from .gaussian_generator import GaussianGenerator
 @dataclass
 class Voter:
     """Represents a voter with party affiliation and ideology."""
+    __slots__ = ('party', 'ideology')
     party: PopulationGroup
     ideology: float
     
@@ -34,14 +35,29 @@ class Voter:
                 candidate.quality)
     
     def favorite(self, candidates: List[Candidate], config: ElectionConfig,
-                gaussian_generator: GaussianGenerator) -> int:
-        """Find the index of the favorite candidate."""
+                gaussian_generator: GaussianGenerator,
+                candidate_table: Optional[CandidateTable] = None) -> int:
+        """Find the index of the favorite candidate.
         
+        Scores are the same as score() but computed from a CandidateTable,
+        which callers can share across voters, with the uncertainty draws
+        taken in one batch. When candidate_table is given its candidates are
+        the ones scored; it must be built from the same candidates.
+        
+        Raises:
+            ValueError: If candidate_table was not built from candidates
+        """
+        if candidate_table is None:
+            candidate_table = CandidateTable.from_list(candidates)
+        else:
+            candidate_table.check_candidates(candidates)
+        
+        noise = gaussian_generator.next_gaussians(len(candidate_table.candidates))
         favorite_idx = -1
         favorite_score = -1000.0
         
-        for i, candidate in enumerate(candidates):
-            score = self.score(candidate, config, gaussian_generator)
+        for i, score in enumerate(candidate_table.scores(
+                self.ideology, self.party.tag.short_name, config.uncertainty, noise)):
             if score > favorite_score:
                 favorite_idx = i
                 favorite_score = score